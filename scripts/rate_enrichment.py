@@ -2,13 +2,16 @@
 """Utility to ask OpenAI GPT-5 to rate enrichment quality."""
 from __future__ import annotations
 
-import json
+import asyncio
 import os
 from pathlib import Path
 from textwrap import dedent
 
+import orjson
+
 try:
-    from openai import OpenAI  # type: ignore
+    import httpx
+    from openai import AsyncOpenAI  # type: ignore
 except ImportError as exc:  # pragma: no cover
     raise SystemExit(
         "Missing dependency: install the OpenAI Python SDK (pip install openai)."
@@ -18,14 +21,47 @@ ROOT = Path(__file__).resolve().parents[1]
 SIMPLE_PATH = ROOT / "catalog" / "simple.json"
 ENRICHED_PATH = ROOT / "catalog" / "enriched.json"
 
+# SKUs per rating request and how many requests may be in flight at once
+CHUNK_SIZE = 20
+MAX_CONCURRENCY = 8
+
 
 def load_catalog(path: Path) -> list[dict]:
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = orjson.loads(path.read_bytes())
     if not isinstance(data, list):  # pragma: no cover - defensive
         raise ValueError("Expected a list of records")
     return data
 
 
+async def rate_chunks(api_key: str, prompt: str, chunks: list[list[dict]]) -> list[dict]:
+    """Rate every chunk concurrently and merge the returned ``ratings`` arrays."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    # One keep-alive pool sized to the concurrency limit, shared by every request
+    limits = httpx.Limits(max_connections=MAX_CONCURRENCY, max_keepalive_connections=MAX_CONCURRENCY)
+    async with httpx.AsyncClient(limits=limits, timeout=httpx.Timeout(120.0, connect=10.0)) as http_client:
+        client = AsyncOpenAI(api_key=api_key, http_client=http_client)
+        results = await asyncio.gather(*(_rate_chunk(client, semaphore, prompt, chunk) for chunk in chunks))
+    return [rating for chunk_ratings in results for rating in chunk_ratings]
+
+
+async def _rate_chunk(client: AsyncOpenAI, semaphore: asyncio.Semaphore, prompt: str, chunk: list[dict]) -> list[dict]:
+    async with semaphore:
+        response = await client.chat.completions.create(
+            model="gpt-5",
+            temperature=0.2,
+            response_format={"type": "json_object"},
+            messages=[
+                {"role": "system", "content": prompt},
+                {"role": "user", "content": orjson.dumps(chunk).decode()},
+            ],
+        )
+
+    content = response.choices[0].message.content if response.choices else None
+    if not content:
+        raise SystemExit("No content returned from GPT-5.")
+    return orjson.loads(content).get("ratings", [])
+
+
 def main() -> int:
     api_key = os.environ.get("OPENAI_API_KEY")
     if not api_key:
@@ -53,8 +89,6 @@ def main() -> int:
     if not evaluation_payload:
         raise SystemExit("No enriched products to evaluate.")
 
-    client = OpenAI(api_key=api_key)
-
     prompt = dedent(
         """
         You are a catalog QA analyst. Rate the enrichment quality for each SKU on a scale of 1-5
@@ -66,20 +100,13 @@ def main() -> int:
         """
     ).strip()
 
-    response = client.chat.completions.create(
-        model="gpt-5",
-        temperature=0.2,
-        messages=[
-            {"role": "system", "content": prompt},
-            {"role": "user", "content": json.dumps(evaluation_payload)},
-        ],
-    )
-
-    content = response.choices[0].message.content if response.choices else None
-    if not content:
-        raise SystemExit("No content returned from GPT-5.")
+    chunks = [
+        evaluation_payload[start:start + CHUNK_SIZE]
+        for start in range(0, len(evaluation_payload), CHUNK_SIZE)
+    ]
+    ratings = asyncio.run(rate_chunks(api_key, prompt, chunks))
 
-    print(content)
+    print(orjson.dumps({"ratings": ratings}, option=orjson.OPT_INDENT_2).decode())
     return 0
 
 
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import argparse
-import json
 import logging
 import sys
 from pathlib import Path
-from typing import Iterable, List
+from typing import Any, BinaryIO, Iterable, List
+
+import orjson
 
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
@@ -29,11 +30,15 @@ CATALOG_SIMPLE = ROOT / "catalog" / "simple.json"
 CATALOG_ENRICHED = ROOT / "catalog" / "enriched.json"
 
 
+def _dumps(obj: Any, option: int = 0) -> str:
+    return orjson.dumps(obj, option=option).decode()
+
+
+_format_event = "  - {timestamp} | {step}: {message}".format_map
+
+
 def format_events(events: Iterable[dict]) -> str:
-    return "\n".join(
-        f"  - {event['timestamp']} | {event['step']}: {event['message']}"
-        for event in events
-    )
+    return "\n".join(map(_format_event, events))
 
 
 def print_text(processed: List[ProcessedProduct]) -> None:
@@ -42,37 +47,49 @@ def print_text(processed: List[ProcessedProduct]) -> None:
         print(f"\nSKU {result.sku} processed. Workflow events:")
         print(format_events(result.serializable_events()))
         print("Enriched payload:")
-        print(json.dumps(result.enriched, indent=2))
+        print(_dumps(result.enriched, orjson.OPT_INDENT_2))
+
+
+def _stdout_buffer() -> BinaryIO:
+    """Return the binary stdout buffer after flushing anything pending in the text layer."""
+    sys.stdout.flush()
+    return sys.stdout.buffer
 
 
 def print_json(processed: List[ProcessedProduct]) -> None:
-    payload = {
-        "workflow_steps": list(WORKFLOW_STEPS),
-        "processed": [
-            {
-                "sku": result.sku,
-                "events": result.serializable_events(),
-                "original": result.original,
-                "enriched": result.enriched,
-            }
-            for result in processed
-        ],
-    }
-    print(json.dumps(payload, indent=2))
+    # Frame the array by hand so each record is encoded once, without building the full payload first
+    out = _stdout_buffer()
+    out.write(b'{"workflow_steps":' + orjson.dumps(list(WORKFLOW_STEPS)) + b',"processed":[')
+    for index, result in enumerate(processed):
+        if index:
+            out.write(b",")
+        out.write(
+            orjson.dumps(
+                {
+                    "sku": result.sku,
+                    "events": result.events,
+                    "original": result.original,
+                    "enriched": result.enriched,
+                }
+            )
+        )
+    out.write(b"]}\n")
+    out.flush()
 
 
 def stream_events(processed: List[ProcessedProduct]) -> None:
-    start = {"type": "start", "workflow_steps": list(WORKFLOW_STEPS)}
-    print(json.dumps(start))
-    sys.stdout.flush()
+    # One flush per product instead of one per line
+    out = _stdout_buffer()
+    line = orjson.OPT_APPEND_NEWLINE
+    out.write(orjson.dumps({"type": "start", "workflow_steps": list(WORKFLOW_STEPS)}, option=line))
+    out.flush()
     for result in processed:
-        for event in result.serializable_events():
-            print(json.dumps({"type": "event", "sku": result.sku, "event": event}))
-            sys.stdout.flush()
-        print(json.dumps({"type": "enriched", "sku": result.sku, "enriched": result.enriched}))
-        sys.stdout.flush()
-    print(json.dumps({"type": "done", "count": len(processed)}))
-    sys.stdout.flush()
+        for event in result.events:
+            out.write(orjson.dumps({"type": "event", "sku": result.sku, "event": event}, option=line))
+        out.write(orjson.dumps({"type": "enriched", "sku": result.sku, "enriched": result.enriched}, option=line))
+        out.flush()
+    out.write(orjson.dumps({"type": "done", "count": len(processed)}, option=line))
+    out.flush()
 
 
 def main() -> int:
@@ -103,19 +120,14 @@ def main() -> int:
 
     if args.dry_run:
         LOGGER.info("Running in dry-run mode; enriched results will not be persisted.")
-        original_enriched = json.loads(CATALOG_ENRICHED.read_text(encoding="utf-8")) if CATALOG_ENRICHED.exists() else []
-    else:
-        original_enriched = None
 
     processed = process_pending_products(
         str(CATALOG_SIMPLE),
         str(CATALOG_ENRICHED),
         process_all=args.all,
+        persist=not args.dry_run,
     )
 
-    if args.dry_run and original_enriched is not None:
-        CATALOG_ENRICHED.write_text(json.dumps(original_enriched, indent=2) + "\n", encoding="utf-8")
-
     if not processed:
         print("No new products to process.")
         return 0
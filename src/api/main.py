@@ -1,14 +1,17 @@
 import asyncio
-import json
+import functools
 import logging
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 from contextlib import asynccontextmanager
 
+import orjson
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 
 # Load environment variables from .env file
 try:
@@ -18,11 +21,14 @@ except ImportError:
     # dotenv not installed, environment variables should be set manually
     pass
 
-from .models import ProductInput, EnrichmentResponse, ErrorResponse, ProcessedProduct, WorkflowEvent
+from .models import ProductInput, EnrichmentResponse, ErrorResponse
 from ..enrichment.pipeline import enrich_product, WORKFLOW_STEPS, ProcessedProduct as PipelineProcessedProduct, LANGGRAPH_AVAILABLE, LANGSMITH_AVAILABLE
-from ..enrichment.catalog_io import append_unique_records, load_json_array
+from ..enrichment.catalog_io import append_unique_records, load_index, load_json_array
+from ..enrichment.status import WorkflowEvent as PipelineWorkflowEvent
 
-logging.basicConfig(level=logging.INFO)
+# Also run in each /api/enrich worker process, which spawn starts without any logging setup
+configure_logging = functools.partial(logging.basicConfig, level=logging.INFO)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 # File paths
@@ -37,12 +43,61 @@ if not SIMPLE_PATH.exists():
 if not ENRICHED_PATH.exists():
     ENRICHED_PATH.write_text("[]")
 
+# Pre-encoded pieces of the per-event SSE frame: {"type":"event","sku":...,"event":...}
+EVENT_PREFIX = b'data: {"type":"event","sku":'
+EVENT_MID = b',"event":'
+EVENT_SUFFIX = b"}\n\n"
+
+# Serializes catalog writes so concurrent flushes don't clobber each other
+CATALOG_LOCK = asyncio.Lock()
+
+# Records waiting to be written; the lifespan flusher drains them every FLUSH_INTERVAL seconds
+FLUSH_INTERVAL = 0.5
+FLUSH_THRESHOLD = 100
+PENDING_SIMPLE: List[Dict[str, Any]] = []
+PENDING_ENRICHED: List[Dict[str, Any]] = []
+FLUSH_TASK: Optional["asyncio.Task[None]"] = None
+FLUSH_STOP: Optional[asyncio.Event] = None
+
+# Encoded /api/products/{simple,enriched} bodies, tagged with the parsed list they were built from
+_BODY_CACHE: Dict[Path, Tuple[List[Dict[str, Any]], bytes]] = {}
+
+# Worker processes for /api/enrich, created by the lifespan handler
+ENRICH_WORKERS = max(1, int(os.getenv("ENRICH_WORKERS", str(os.cpu_count() or 1))))
+EXECUTOR: Optional[ProcessPoolExecutor] = None
+EXECUTOR_SLOTS: Optional[asyncio.Semaphore] = None
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    global EXECUTOR, EXECUTOR_SLOTS, FLUSH_TASK, FLUSH_STOP
     logger.info("Starting FastAPI Catalog Enrichment API")
-    yield
-    logger.info("Shutting down FastAPI Catalog Enrichment API")
+    # spawn rather than fork: the server process already runs threads
+    EXECUTOR = ProcessPoolExecutor(
+        max_workers=ENRICH_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=configure_logging,
+    )
+    # Bound in-flight submissions to the pool size so requests don't pile up in its queue
+    EXECUTOR_SLOTS = asyncio.Semaphore(ENRICH_WORKERS)
+    FLUSH_STOP = asyncio.Event()
+    FLUSH_TASK = asyncio.create_task(_flush_periodically(FLUSH_STOP))
+    try:
+        await asyncio.to_thread(_warm_catalogs)
+    except Exception:
+        logger.exception("Error preloading catalogs")
+    try:
+        yield
+    finally:
+        # Ask the flusher to stop rather than cancelling it, so a write in progress finishes first
+        FLUSH_STOP.set()
+        await FLUSH_TASK
+        FLUSH_TASK = FLUSH_STOP = None
+        await flush_pending()
+        # Joining the workers blocks, so keep it off the event loop
+        await asyncio.to_thread(EXECUTOR.shutdown, cancel_futures=True)
+        EXECUTOR = EXECUTOR_SLOTS = None
+        logger.info("Shutting down FastAPI Catalog Enrichment API")
 
 
 app = FastAPI(
@@ -62,24 +117,52 @@ app.add_middleware(
 )
 
 
-def convert_pipeline_product(pipeline_product: PipelineProcessedProduct) -> ProcessedProduct:
-    """Convert pipeline ProcessedProduct to API ProcessedProduct"""
-    events = [
-        WorkflowEvent(
-            step=event.step,
-            message=event.message,
-            timestamp=event.timestamp,
-            payload=event.payload
-        )
-        for event in pipeline_product.events
-    ]
-
-    return ProcessedProduct(
-        sku=pipeline_product.sku,
-        original=pipeline_product.original,
-        enriched=pipeline_product.enriched,
-        events=events
-    )
+def _to_pipeline_dict(product_data: ProductInput) -> Dict[str, Any]:
+    """Convert ProductInput to the dict format expected by the pipeline"""
+    product_dict = product_data.model_dump()
+    if product_dict["attributes"] is None:
+        product_dict["attributes"] = {}
+    return product_dict
+
+
+def serialize_enrichment(pipeline_product: PipelineProcessedProduct) -> bytes:
+    """Encode an ``EnrichmentResponse``-shaped body straight from the pipeline result"""
+    return orjson.dumps({
+        "success": True,
+        "processed": {
+            "sku": pipeline_product.sku,
+            "original": pipeline_product.original,
+            "enriched": pipeline_product.enriched,
+            # Event dataclasses are encoded by orjson directly, without as_dict() copies
+            "events": pipeline_product.events,
+        },
+        "workflow_steps": list(WORKFLOW_STEPS),
+    })
+
+
+async def run_enrichment(product_dict: Dict[str, Any]) -> PipelineProcessedProduct:
+    """Run the pipeline in the worker process pool, or a thread when the pool isn't running."""
+    if EXECUTOR is None or EXECUTOR_SLOTS is None:
+        return await asyncio.to_thread(enrich_product, product_dict)
+    async with EXECUTOR_SLOTS:
+        return await asyncio.get_running_loop().run_in_executor(EXECUTOR, enrich_product, product_dict)
+
+
+def start_enrichment(product_dict: Dict[str, Any]) -> Tuple["asyncio.Future[PipelineProcessedProduct]", "asyncio.Queue[PipelineWorkflowEvent | None]"]:
+    """Run the pipeline in a worker thread, forwarding events to a queue as they are produced.
+
+    The queue receives ``None`` once the worker finishes; await the returned
+    future afterwards for the processed product (or the pipeline's exception).
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[PipelineWorkflowEvent | None] = asyncio.Queue()
+
+    def on_event(event: PipelineWorkflowEvent) -> None:
+        loop.call_soon_threadsafe(queue.put_nowait, event)
+
+    worker = asyncio.ensure_future(asyncio.to_thread(enrich_product, product_dict, on_event))
+    worker.add_done_callback(lambda _: queue.put_nowait(None))
+    return worker, queue
 
 
 @app.get("/")
@@ -100,35 +183,20 @@ async def health_check():
     }
 
 
-@app.post("/api/enrich", response_model=EnrichmentResponse)
-async def enrich_product_endpoint(product_data: ProductInput):
+# The pipeline output is returned as-is; EnrichmentResponse only documents its shape
+@app.post("/api/enrich", responses={200: {"model": EnrichmentResponse}})
+async def enrich_product_endpoint(product_data: ProductInput) -> Response:
     """Enrich a single product through the multi-agent pipeline"""
     try:
-        # Convert ProductInput to dict format expected by pipeline
-        product_dict = {
-            "sku": product_data.sku,
-            "name": product_data.name,
-            "description": product_data.description,
-            "category": product_data.category,
-            "price": product_data.price,
-            "currency": product_data.currency,
-            "attributes": product_data.attributes or {}
-        }
+        product_dict = _to_pipeline_dict(product_data)
 
-        # Run enrichment pipeline
-        processed = enrich_product(product_dict)
+        # Run enrichment pipeline in a worker process so other requests keep being served
+        processed = await run_enrichment(product_dict)
 
         # Save to catalogs
         await save_to_catalogs(product_dict, processed.enriched)
 
-        # Convert to API model
-        api_processed = convert_pipeline_product(processed)
-
-        return EnrichmentResponse(
-            success=True,
-            processed=api_processed,
-            workflow_steps=list(WORKFLOW_STEPS)
-        )
+        return Response(content=serialize_enrichment(processed), media_type="application/json")
 
     except Exception as e:
         logger.exception("Error enriching product %s", product_data.sku)
@@ -140,40 +208,23 @@ async def enrich_product_stream(product_data: ProductInput):
     """Stream enrichment progress in real-time"""
 
     async def generate_stream():
+        dumps = orjson.dumps
         try:
-            # Convert ProductInput to dict format
-            product_dict = {
-                "sku": product_data.sku,
-                "name": product_data.name,
-                "description": product_data.description,
-                "category": product_data.category,
-                "price": product_data.price,
-                "currency": product_data.currency,
-                "attributes": product_data.attributes or {}
-            }
+            product_dict = _to_pipeline_dict(product_data)
 
             # Send acknowledgment
-            yield f"data: {json.dumps({'type': 'ack', 'product': product_dict})}\n\n"
+            yield b"data: " + dumps({'type': 'ack', 'product': product_dict}) + b"\n\n"
 
             # Send workflow steps
-            yield f"data: {json.dumps({'type': 'workflow', 'steps': list(WORKFLOW_STEPS)})}\n\n"
-
-            # Run enrichment and stream events
-            processed = enrich_product(product_dict)
-
-            # Stream events
-            for event in processed.events:
-                event_data = {
-                    'type': 'event',
-                    'sku': processed.sku,
-                    'event': {
-                        'step': event.step,
-                        'message': event.message,
-                        'timestamp': event.timestamp.isoformat() if hasattr(event.timestamp, 'isoformat') else str(event.timestamp),
-                        'payload': event.payload
-                    }
-                }
-                yield f"data: {json.dumps(event_data)}\n\n"
+            yield b"data: " + dumps({'type': 'workflow', 'steps': list(WORKFLOW_STEPS)}) + b"\n\n"
+
+            # Run enrichment in the background and stream events as they happen
+            worker, events = start_enrichment(product_dict)
+            # orjson encodes the event dataclass directly, no intermediate dict
+            sku_bytes = dumps(product_data.sku)
+            while (event := await events.get()) is not None:
+                yield EVENT_PREFIX + sku_bytes + EVENT_MID + dumps(event) + EVENT_SUFFIX
+            processed = await worker
 
             # Stream enriched result
             enriched_data = {
@@ -181,14 +232,14 @@ async def enrich_product_stream(product_data: ProductInput):
                 'sku': processed.sku,
                 'enriched': processed.enriched
             }
-            yield f"data: {json.dumps(enriched_data)}\n\n"
+            yield b"data: " + dumps(enriched_data) + b"\n\n"
 
             # Save to catalogs
             await save_to_catalogs(product_dict, processed.enriched)
 
             # Send completion
-            yield f"data: {json.dumps({'type': 'done', 'count': 1})}\n\n"
-            yield f"data: {json.dumps({'type': 'complete', 'exitCode': 0})}\n\n"
+            yield b"data: " + dumps({'type': 'done', 'count': 1}) + b"\n\n"
+            yield b"data: " + dumps({'type': 'complete', 'exitCode': 0}) + b"\n\n"
 
         except Exception as e:
             logger.exception("Error in stream enrichment")
@@ -196,7 +247,7 @@ async def enrich_product_stream(product_data: ProductInput):
                 'type': 'error',
                 'message': str(e)
             }
-            yield f"data: {json.dumps(error_data)}\n\n"
+            yield b"data: " + dumps(error_data) + b"\n\n"
 
     return StreamingResponse(
         generate_stream(),
@@ -208,12 +259,28 @@ async def enrich_product_stream(product_data: ProductInput):
     )
 
 
+def _catalog_body(path: Path) -> bytes:
+    # Re-encode only when load_json_array hands back a different (re-read or appended) list
+    products = load_json_array(path)
+    hit = _BODY_CACHE.get(path)
+    if hit is None or hit[0] is not products:
+        hit = _BODY_CACHE[path] = (products, orjson.dumps({"products": products, "count": len(products)}))
+    return hit[1]
+
+
+def _warm_catalogs() -> None:
+    # Parse, index and encode both catalogs up front so first requests skip the disk read
+    for path in (SIMPLE_PATH, ENRICHED_PATH):
+        _catalog_body(path)
+        load_index(path, "sku")
+
+
 @app.get("/api/products/simple")
 async def get_simple_products():
     """Get all products from simple catalog"""
     try:
-        products = load_json_array(SIMPLE_PATH)
-        return {"products": products, "count": len(products)}
+        body = await asyncio.to_thread(_catalog_body, SIMPLE_PATH)
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         logger.exception("Error loading simple products")
         raise HTTPException(status_code=500, detail=f"Failed to load products: {str(e)}")
@@ -223,22 +290,32 @@ async def get_simple_products():
 async def get_enriched_products():
     """Get all enriched products"""
     try:
-        products = load_json_array(ENRICHED_PATH)
-        return {"products": products, "count": len(products)}
+        body = await asyncio.to_thread(_catalog_body, ENRICHED_PATH)
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         logger.exception("Error loading enriched products")
         raise HTTPException(status_code=500, detail=f"Failed to load enriched products: {str(e)}")
 
 
+def _lookup_sku(sku: str) -> Tuple[Dict[str, Any] | None, Dict[str, Any] | None]:
+    # Both catalogs in one worker hop; each lookup is a dict hit once the indexes are warm
+    return load_index(SIMPLE_PATH, "sku").get(sku), load_index(ENRICHED_PATH, "sku").get(sku)
+
+
+def _find_pending(records: List[Dict[str, Any]], sku: str) -> Dict[str, Any] | None:
+    return next((record for record in records if record["sku"] == sku), None)
+
+
 @app.get("/api/products/{sku}")
 async def get_product_by_sku(sku: str):
     """Get a specific product by SKU from both catalogs"""
     try:
-        simple_products = load_json_array(SIMPLE_PATH)
-        enriched_products = load_json_array(ENRICHED_PATH)
-
-        simple_product = next((p for p in simple_products if p.get("sku") == sku), None)
-        enriched_product = next((p for p in enriched_products if p.get("sku") == sku), None)
+        simple_product, enriched_product = await asyncio.to_thread(_lookup_sku, sku)
+        # Records saved since the last flush are not on disk yet
+        if simple_product is None:
+            simple_product = _find_pending(PENDING_SIMPLE, sku)
+        if enriched_product is None:
+            enriched_product = _find_pending(PENDING_ENRICHED, sku)
 
         if not simple_product and not enriched_product:
             raise HTTPException(status_code=404, detail=f"Product with SKU {sku} not found")
@@ -255,27 +332,85 @@ async def get_product_by_sku(sku: str):
         raise HTTPException(status_code=500, detail=f"Failed to load product: {str(e)}")
 
 
-async def save_to_catalogs(simple_product: Dict[str, Any], enriched_product: Dict[str, Any]):
-    """Save product to both simple and enriched catalogs"""
+def _save_to_catalogs_sync(simple_products: List[Dict[str, Any]], enriched_products: List[Dict[str, Any]]) -> None:
+    # Save to simple catalog
+    append_unique_records(
+        SIMPLE_PATH,
+        new_records=simple_products,
+        key="sku"
+    )
+
+    # Save to enriched catalog
+    append_unique_records(
+        ENRICHED_PATH,
+        new_records=enriched_products,
+        key="sku"
+    )
+
+
+async def _write_catalogs(simple_products: List[Dict[str, Any]], enriched_products: List[Dict[str, Any]]) -> None:
+    """Write to both catalogs in a worker thread.
+
+    The thread can't be interrupted, so if the awaiting task is cancelled this
+    still waits for the write to finish before re-raising. Callers hold
+    CATALOG_LOCK throughout, so no second writer starts on the same files.
+    """
+    write = asyncio.ensure_future(asyncio.to_thread(_save_to_catalogs_sync, simple_products, enriched_products))
     try:
-        # Save to simple catalog
-        simple_products = load_json_array(SIMPLE_PATH)
-        append_unique_records(
-            SIMPLE_PATH,
-            existing=simple_products,
-            new_records=[simple_product],
-            key="sku"
-        )
-
-        # Save to enriched catalog
-        enriched_products = load_json_array(ENRICHED_PATH)
-        append_unique_records(
-            ENRICHED_PATH,
-            existing=enriched_products,
-            new_records=[enriched_product],
-            key="sku"
-        )
+        await asyncio.shield(write)
+    except asyncio.CancelledError:
+        await write
+        raise
+
+
+async def flush_pending() -> None:
+    """Write buffered records to both catalogs in one batch"""
+    async with CATALOG_LOCK:
+        simple_products, enriched_products = PENDING_SIMPLE[:], PENDING_ENRICHED[:]
+        if not simple_products and not enriched_products:
+            return
+        written = False
+        try:
+            await _write_catalogs(simple_products, enriched_products)
+            written = True
+        except asyncio.CancelledError:
+            # Only raised once the write has completed
+            written = True
+            raise
+        finally:
+            if written:
+                # Drop only what was written; requests may have queued more in the meantime
+                del PENDING_SIMPLE[:len(simple_products)]
+                del PENDING_ENRICHED[:len(enriched_products)]
+
+
+async def _flush_periodically(stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        try:
+            await asyncio.wait_for(stop.wait(), FLUSH_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+        try:
+            await flush_pending()
+        except Exception:
+            logger.exception("Error flushing catalog writes")
+
 
+async def save_to_catalogs(simple_product: Dict[str, Any], enriched_product: Dict[str, Any]):
+    """Save product to both simple and enriched catalogs
+
+    While the app's lifespan is running, records are buffered and written by
+    the background flusher; otherwise they are written immediately.
+    """
+    try:
+        if FLUSH_TASK is None:
+            async with CATALOG_LOCK:
+                await _write_catalogs([simple_product], [enriched_product])
+            return
+        PENDING_SIMPLE.append(simple_product)
+        PENDING_ENRICHED.append(enriched_product)
+        if len(PENDING_SIMPLE) >= FLUSH_THRESHOLD:
+            await flush_pending()
     except Exception as e:
         logger.exception("Error saving to catalogs")
         raise
@@ -1,38 +1,202 @@
 """Helpers for reading/writing catalog data."""
 from __future__ import annotations
 
-import json
+import mmap
+import os
 from pathlib import Path
-from typing import Iterable, List, Dict, Any
+from typing import Iterable, List, Dict, Any, Set, Tuple
+
+import orjson
+
+# Parsed arrays keyed by path, tagged with the (mtime_ns, size) they were read at
+_CACHE: Dict[Path, Tuple[int, int, List[Dict[str, Any]]]] = {}
+
+# Key -> record maps built from a cached array, tagged with the list they index
+_KEYED_CACHE: Dict[Tuple[Path, str], Tuple[List[Dict[str, Any]], Dict[Any, Dict[str, Any]]]] = {}
+
+# Known key sets per (path, key), tagged with the catalog (mtime_ns, size) they describe
+_KEYS_CACHE: Dict[Tuple[Path, str], Tuple[int, int, Set[Any]]] = {}
+
+# Files at least this large are parsed from a read-only memory map instead of a bytes copy
+_MMAP_THRESHOLD = 64 * 1024
+
+# How much of the file end to inspect when locating the closing bracket
+_TAIL_BYTES = 4096
+
+
+def _parse_file(path: Path, size: int) -> Any:
+    if size < _MMAP_THRESHOLD:
+        return orjson.loads(path.read_bytes())
+    with path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        with memoryview(mapped) as view:
+            return orjson.loads(view)
 
 
 def load_json_array(path: Path) -> List[Dict[str, Any]]:
-    """Return a list parsed from a JSON array file."""
-    if not path.exists():
+    """Return a list parsed from a JSON array file.
+
+    Results are cached until the file's mtime or size changes, so the returned
+    list is shared between callers and must not be mutated in place.
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
         return []
-    data = json.loads(path.read_text(encoding="utf-8"))
+    hit = _CACHE.get(path)
+    if hit is not None and hit[:2] == (stat.st_mtime_ns, stat.st_size):
+        return hit[2]
+    data = _parse_file(path, stat.st_size)
     if not isinstance(data, list):
         raise ValueError(f"Expected list in {path}, found {type(data).__name__}")
+    _CACHE[path] = (stat.st_mtime_ns, stat.st_size, data)
     return data
 
 
+def load_index(path: Path, key: str) -> Dict[Any, Dict[str, Any]]:
+    """Return records from ``path`` keyed by ``key``, keeping the first record per key.
+
+    The mapping is rebuilt only when the underlying array is re-read, and like
+    ``load_json_array`` results it is shared and must not be mutated.
+    """
+    records = load_json_array(path)
+    hit = _KEYED_CACHE.get((path, key))
+    if hit is not None and hit[0] is records:
+        return hit[1]
+    index = {record[key]: record for record in reversed(records) if key in record}
+    _KEYED_CACHE[(path, key)] = (records, index)
+    return index
+
+
 def write_json_array(path: Path, records: Iterable[Dict[str, Any]]) -> None:
     """Write iterable of dicts as JSON array with trailing newline."""
     array = list(records)
-    path.write_text(json.dumps(array, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    path.write_bytes(orjson.dumps(array, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    stat = path.stat()
+    _CACHE[path] = (stat.st_mtime_ns, stat.st_size, array)
 
 
-def append_unique_records(path: Path, *, existing: List[Dict[str, Any]], new_records: Iterable[Dict[str, Any]], key: str) -> List[Dict[str, Any]]:
-    """Append new records keyed by ``key`` without duplicating existing entries."""
-    seen = {record[key] for record in existing if key in record}
-    appended: List[Dict[str, Any]] = list(existing)
+def _index_path(path: Path) -> Path:
+    return path.with_suffix(".idx")
+
+
+def load_keys(path: Path, key: str, *, write_index: bool = True) -> Set[Any]:
+    """Return the ``key`` values present in ``path``.
+
+    Served from memory while the catalog is unchanged, then from the sidecar
+    index when it is current, and only otherwise by scanning the array (which
+    then refreshes the sidecar so the next process can skip the parse, unless
+    ``write_index`` is false). The returned set is shared and must not be
+    mutated by callers.
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return set()
+    version = (stat.st_mtime_ns, stat.st_size)
+    hit = _KEYS_CACHE.get((path, key))
+    if hit is not None and hit[:2] == version:
+        return hit[2]
+    try:
+        index = orjson.loads(_index_path(path).read_bytes())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        index = None
+    if (
+        isinstance(index, dict)
+        and index.get("key") == key
+        and index.get("mtime_ns") == stat.st_mtime_ns
+        and index.get("size") == stat.st_size
+    ):
+        keys = set(index["keys"])
+    else:
+        keys = {record[key] for record in load_json_array(path) if key in record}
+        if write_index:
+            try:
+                _write_known_keys(path, key, keys)
+                return keys
+            except OSError:  # read-only catalog directory; keep the keys in memory only
+                pass
+    _KEYS_CACHE[(path, key)] = (*version, keys)
+    return keys
+
+
+def _write_known_keys(path: Path, key: str, keys: Set[Any]) -> None:
+    """Atomically persist ``keys`` tagged with the catalog's current mtime and size."""
+    stat = path.stat()
+    index_path = _index_path(path)
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    tmp_path.write_bytes(
+        orjson.dumps({"key": key, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "keys": list(keys)})
+    )
+    os.replace(tmp_path, index_path)
+    _KEYS_CACHE[(path, key)] = (stat.st_mtime_ns, stat.st_size, keys)
+
+
+def _splice_records(path: Path, records: List[Dict[str, Any]]) -> bool:
+    """Append ``records`` before the closing bracket of the array in ``path``.
+
+    Output matches ``write_json_array`` byte for byte. Returns ``False`` when the
+    file tail doesn't look like a JSON array so the caller can rewrite it instead.
+    """
+    # "[\n  {...},\n  {...}\n]" - drop the opening bracket, keep the indented elements
+    body = orjson.dumps(records, option=orjson.OPT_INDENT_2)[1:] + b"\n"
+    with path.open("r+b") as handle:
+        end = handle.seek(0, os.SEEK_END)
+        start = max(end - _TAIL_BYTES, 0)
+        handle.seek(start)
+        tail = handle.read().rstrip()
+        if not tail.endswith(b"]"):
+            return False
+        head = tail[:-1].rstrip()
+        if not head:
+            return False
+        handle.seek(start + len(head))
+        # Write over the old tail before truncating: readers may have the file mmapped, and
+        # shrinking it under them (even briefly) can SIGBUS the reading process
+        handle.write(body if head.endswith(b"[") else b"," + body)
+        handle.truncate()
+    return True
+
+
+def append_unique_records(path: Path, *, new_records: Iterable[Dict[str, Any]], key: str) -> List[Dict[str, Any]]:
+    """Append new records keyed by ``key`` without duplicating existing entries.
+
+    Only the new records are written: they are spliced in before the array's
+    closing bracket, and the known keys are kept in memory and in a ``.idx``
+    file next to the catalog so the existing array doesn't have to be parsed
+    on every call.
+    Returns the records that were actually appended.
+    """
+    seen = load_keys(path, key)
+    added: Set[Any] = set()
+    appended: List[Dict[str, Any]] = []
     for record in new_records:
         identifier = record.get(key)
         if identifier is None:
             raise ValueError(f"Record missing key '{key}': {record}")
-        if identifier in seen:
+        if identifier in seen or identifier in added:
             continue
         appended.append(record)
-        seen.add(identifier)
-    write_json_array(path, appended)
+        added.add(identifier)
+    if not appended:
+        return appended
+
+    try:
+        before = path.stat()
+    except FileNotFoundError:
+        write_json_array(path, appended)
+    else:
+        cached = _CACHE.get(path)
+        if _splice_records(path, appended):
+            after = path.stat()
+            if cached is not None and cached[:2] == (before.st_mtime_ns, before.st_size):
+                _CACHE[path] = (after.st_mtime_ns, after.st_size, cached[2] + appended)
+        else:
+            write_json_array(path, [*load_json_array(path), *appended])
+    # Only grow the shared set once the write has succeeded
+    seen |= added
+    try:
+        _write_known_keys(path, key, seen)
+    except OSError:  # the records are saved; keep the keys in memory and rescan next process
+        stat = path.stat()
+        _KEYS_CACHE[(path, key)] = (stat.st_mtime_ns, stat.st_size, seen)
     return appended
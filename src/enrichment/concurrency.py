@@ -0,0 +1,19 @@
+"""Helpers for running blocking work concurrently."""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def parallel_map(fn: Callable[[T], R], items: Iterable[T], *, max_workers: int = 8) -> List[R]:
+    """Apply ``fn`` to every item on a thread pool and return results in input order.
+
+    Every task is submitted before any result is awaited, so the calls really
+    overlap; the first exception raised by ``fn`` propagates to the caller.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(fn, item) for item in items]
+        return [future.result() for future in futures]
@@ -0,0 +1,104 @@
+"""Content-addressed cache for OpenAI JSON completions."""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import orjson
+
+LOGGER = logging.getLogger(__name__)
+
+# Set ENRICHMENT_NO_CACHE to always call the API; replies are otherwise reused in-process and on disk
+_DISABLED = bool(os.getenv("ENRICHMENT_NO_CACHE"))
+_CACHE_DIR = Path(os.getenv("ENRICHMENT_CACHE_DIR", ".enrich-cache"))
+_MEMORY_SIZE = 1024
+
+_MEMORY: "OrderedDict[str, bytes]" = OrderedDict()
+_LOCK = threading.Lock()
+
+
+def cache_key(request: Dict[str, Any]) -> str:
+    """Hash every completion parameter (model, messages, temperature, response format, ...)."""
+    return hashlib.blake2b(orjson.dumps(request, option=orjson.OPT_SORT_KEYS), digest_size=16).hexdigest()
+
+
+def cached_json_completion(
+    client, *, validate: Optional[Callable[[Any], None]] = None, **request: Any
+) -> Tuple[Any, int]:
+    """Return the parsed JSON reply to ``request`` and the tokens it cost (0 when served from cache).
+
+    ``client.chat.completions.create`` is only called on a miss. ``validate``
+    may raise ``ValueError`` to reject a parsed reply; replies are stored only
+    once they parse and pass it, so a malformed or incomplete answer is
+    retried next time. Cached entries that no longer pass are discarded.
+    """
+    key = None if _DISABLED else cache_key(request)
+    if key is not None:
+        content = _lookup(key)
+        if content is not None:
+            try:
+                parsed = orjson.loads(content)
+                if validate is not None:
+                    validate(parsed)
+            except ValueError:
+                _discard(key)
+            else:
+                return parsed, 0
+
+    response = client.chat.completions.create(**request)
+    content = (response.choices[0].message.content or "").encode()
+    parsed = orjson.loads(content)
+    if validate is not None:
+        validate(parsed)
+    if key is not None:
+        _store(key, content)
+    return parsed, response.usage.total_tokens
+
+
+def _lookup(key: str) -> Optional[bytes]:
+    with _LOCK:
+        content = _MEMORY.get(key)
+        if content is not None:
+            _MEMORY.move_to_end(key)
+            return content
+    try:
+        content = (_CACHE_DIR / f"{key}.json").read_bytes()
+    except OSError:
+        return None
+    _remember(key, content)
+    return content
+
+
+def _store(key: str, content: bytes) -> None:
+    _remember(key, content)
+    path = _CACHE_DIR / f"{key}.json"
+    # /api/enrich runs in a process pool, so thread idents alone can collide across workers
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
+    except OSError as exc:  # pragma: no cover - cache is best effort
+        LOGGER.warning("Could not persist LLM cache entry %s: %s", key, exc)
+
+
+def _discard(key: str) -> None:
+    with _LOCK:
+        _MEMORY.pop(key, None)
+    try:
+        (_CACHE_DIR / f"{key}.json").unlink()
+    except OSError:
+        pass
+
+
+def _remember(key: str, content: bytes) -> None:
+    with _LOCK:
+        _MEMORY[key] = content
+        _MEMORY.move_to_end(key)
+        while len(_MEMORY) > _MEMORY_SIZE:
+            _MEMORY.popitem(last=False)
@@ -3,13 +3,21 @@ from __future__ import annotations
 
 import logging
 import math
+import operator
+import importlib.util
 import os
+import re
+import threading
 import time
+import types
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, TypedDict
+from typing import Annotated, Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, TypedDict
 
-from .catalog_io import append_unique_records, load_json_array
+from .catalog_io import append_unique_records, load_json_array, load_keys
+from .concurrency import parallel_map
+from .llm_cache import cached_json_completion
 from .status import WorkflowEvent
 
 LOGGER = logging.getLogger(__name__)
@@ -37,9 +45,12 @@ else:
     TRY_LANGSMITH_ERROR = None
 
 try:  # pragma: no cover - requires optional dependency
-    from openai import OpenAI
+    import httpx
+    from openai import OpenAI, OpenAIError
 except Exception as exc:  # pragma: no cover - dependency missing/not reachable
+    httpx = None  # type: ignore
     OpenAI = None  # type: ignore
+    OpenAIError = None  # type: ignore
     TRY_OPENAI_ERROR = exc
 else:
     TRY_OPENAI_ERROR = None
@@ -48,22 +59,168 @@ LANGGRAPH_AVAILABLE = StateGraph is not None
 LANGSMITH_AVAILABLE = LangSmithClient is not None
 OPENAI_AVAILABLE = OpenAI is not None
 
+# JSON mode needs a model that supports it; override per deployment with OPENAI_MODEL
+_OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+_JSON_RESPONSE_FORMAT = {"type": "json_object"}
+# API/network failures and unusable replies (bad JSON, missing fields) fall back; anything else propagates
+_AI_ERRORS: Tuple[type, ...] = (ValueError, KeyError) if OpenAIError is None else (OpenAIError, ValueError, KeyError)
+
+# Guards one-time construction of the OpenAI client and compiled graph across threads
+_INIT_LOCK = threading.Lock()
+
+# HTTP/2 multiplexing for OpenAI calls needs the optional `h2` package (httpx[http2])
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 # Initialize OpenAI client
 _openai_client = None
+_openai_client_resolved = False
+
 
 def _get_openai_client():
-    global _openai_client
-    if not OPENAI_AVAILABLE:
-        return None
-    if _openai_client is None:
-        api_key = os.getenv("OPENAI_API_KEY")
-        if api_key:
-            _openai_client = OpenAI(api_key=api_key)  # type: ignore
-            LOGGER.info("OpenAI client initialized")
-        else:
-            LOGGER.warning("OPENAI_API_KEY not set - using fallback implementations")
+    global _openai_client, _openai_client_resolved
+    if _openai_client_resolved:
+        return _openai_client
+    with _INIT_LOCK:
+        if not _openai_client_resolved:
+            if OPENAI_AVAILABLE:
+                api_key = os.getenv("OPENAI_API_KEY")
+                if api_key:
+                    # One pooled client shared by every worker thread keeps connections warm across calls
+                    http_client = httpx.Client(
+                        http2=_HTTP2_AVAILABLE,
+                        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+                        timeout=httpx.Timeout(30.0, connect=5.0),
+                    )
+                    _openai_client = OpenAI(api_key=api_key, http_client=http_client)  # type: ignore
+                    LOGGER.info("OpenAI client initialized")
+                else:
+                    LOGGER.warning("OPENAI_API_KEY not set - using fallback implementations")
+            _openai_client_resolved = True
     return _openai_client
 
+
+# Optional per-node pause (seconds) to make orchestration visible in demos; read once at import
+_DEBUG_DELAY = float(os.getenv("ENRICHMENT_DEBUG_DELAY") or 0)
+
+# Products enriched concurrently by process_pending_products
+_ENRICH_CONCURRENCY = max(1, int(os.getenv("ENRICH_CONCURRENCY", "8")))
+
+# Most recent events kept on each ProcessedProduct; on_event listeners still receive every event
+_MAX_EVENTS = max(0, int(os.getenv("ENRICH_MAX_EVENTS", "256")))
+
+# (attribute, source unit) -> (multiplier, target unit) used by _convert_units
+_CONVERSIONS: Dict[Tuple[str, str], Tuple[float, str]] = {
+    ("capacity", "oz"): (29.5735, "ml"),
+    ("volume", "oz"): (29.5735, "ml"),
+    ("weight", "lb"): (0.453592, "kg"),
+    ("weight", "lbs"): (0.453592, "kg"),
+}
+# Leading number followed by a unit word, e.g. "20 oz" or "1.5lbs"
+_NUM_UNIT_RE = re.compile(r"^\s*(\d+(?:\.\d*)?|\.\d+)\s*([a-z]+)")
+
+_LOCALE_NAMES = {"es-ES": "Spanish", "fr-FR": "French"}
+
+
+# Prompt scaffolding is built once at import; calls only fill in the product fields with str.format
+_EXTRACT_SYSTEM = (
+    "You are an expert product data analyst. Extract structured product attributes from product information. "
+    "Respond only with valid JSON."
+)
+_EXTRACT_PROMPT = """
+Analyze this product and extract structured attributes. Focus on key product characteristics that would be useful for e-commerce:
+
+Product Name: {name}
+Description: {description}
+Category: {category}
+Existing Attributes: {attributes}
+
+Extract and normalize the following types of attributes when applicable:
+- Physical properties (color, size, weight, dimensions)
+- Material and composition
+- Technical specifications
+- Style and design features
+- Compatibility information
+- Usage characteristics
+
+Return a JSON object with normalized attribute names (lowercase, underscore-separated) and clear values.
+Include a confidence score (0-1) for each extracted attribute.
+"""
+
+_SEO_SYSTEM = (
+    "You are an expert SEO copywriter specializing in e-commerce product optimization. Create compelling, "
+    "conversion-focused copy that ranks well and drives sales. Respond only with valid JSON."
+)
+_SEO_PROMPT = """
+Create compelling SEO-optimized copy for this e-commerce product:
+
+Product Name: {name}
+Description: {description}
+Category: {category}
+Price: ${price} {currency}
+Key Attributes: {attributes}
+
+Generate:
+1. SEO Title (50-60 chars): Compelling, keyword-rich page title
+2. Meta Description (150-160 chars): Engaging description that drives clicks
+3. Keywords (5-10): Relevant search terms for this product
+
+Focus on:
+- Benefits and unique features
+- Target customer intent
+- Natural keyword integration
+- Compelling calls to action
+
+Return JSON format:
+{{
+    "title": "SEO title here",
+    "description": "Meta description here",
+    "keywords": ["keyword1", "keyword2", "keyword3"],
+    "long_description": "Detailed product description for product pages"
+}}
+"""
+
+_LOCALIZE_SYSTEM = (
+    "You are an expert translator and localizer specializing in e-commerce copy for {markets} markets. "
+    "Provide culturally appropriate, SEO-optimized translations. Respond only with valid JSON."
+)
+_LOCALIZE_REQUIREMENTS = """
+Original Title: {title}
+Original Description: {description}
+Long Description: {long_description}
+
+Requirements:
+- Maintain SEO effectiveness
+- Adapt cultural references and selling points
+- Keep character limits similar to original
+- Use natural, native-sounding language
+- Preserve key product information
+"""
+_LOCALIZE_BATCH_PROMPT = """
+Translate and localize this e-commerce product copy for each of these locales:
+{locale_list}
+Adapt the content for each market's preferences and cultural context:
+""" + _LOCALIZE_REQUIREMENTS + """
+Return a JSON object keyed by locale code:
+{{
+    "{first_locale}": {{
+        "title": "Translated title",
+        "description": "Translated description",
+        "long_description": "Translated long description"
+    }}
+}}
+"""
+_LOCALIZE_PROMPT = """
+Translate and localize this e-commerce product copy to {locale_name}.
+Adapt the content for {locale_name} market preferences and cultural context:
+""" + _LOCALIZE_REQUIREMENTS + """
+Return JSON format:
+{{
+    "title": "Translated title",
+    "description": "Translated description",
+    "long_description": "Translated long description"
+}}
+"""
+
 WORKFLOW_STEPS: Sequence[str] = (
     "ingest",
     "extract",
@@ -76,7 +233,9 @@ WORKFLOW_STEPS: Sequence[str] = (
 
 class EnrichmentState(TypedDict, total=False):
     product: Dict[str, Any]
-    events: List[WorkflowEvent]
+    # Nodes return only the events they produced; the reducer concatenates them,
+    # so parallel branches can't overwrite each other's events
+    events: Annotated[List[WorkflowEvent], operator.add]
     normalized_attributes: Dict[str, Any]
     pricing: Dict[str, Any]
     seo: Dict[str, Any]
@@ -117,6 +276,10 @@ def _configure_langsmith():
     return True
 
 
+# Resolved once at import; the environment doesn't change between products
+_LANGSMITH_CONFIGURED = _configure_langsmith()
+
+
 def _get_graph():  # pragma: no cover - exercised via integration path
     global _GRAPH
     if not LANGGRAPH_AVAILABLE:
@@ -124,45 +287,57 @@ def _get_graph():  # pragma: no cover - exercised via integration path
             "LangGraph is not installed. Install `langgraph` to enable graph orchestration."
         ) from TRY_LANGGRAPH_ERROR
 
-    if _GRAPH is None:
-        # Configure LangSmith if available
-        langsmith_configured = _configure_langsmith()
+    if _GRAPH is not None:
+        return _GRAPH
 
-        builder = StateGraph(EnrichmentState)  # type: ignore[operator]
+    with _INIT_LOCK:
+        if _GRAPH is None:
+            _GRAPH = _build_graph()
+    return _GRAPH
 
-        # Add artificial delays to make workflow steps visible
-        builder.add_node("ingest", _node_ingest)
-        builder.add_node("extract", _node_extract)
-        builder.add_node("validate", _node_validate)
-        builder.add_node("copywrite", _node_copywrite)
-        builder.add_node("localize", _node_localize)
-        builder.add_node("publish", _node_publish)
 
-        builder.set_entry_point("ingest")
-        builder.add_edge("ingest", "extract")
-        builder.add_edge("extract", "validate")
-        builder.add_edge("validate", "copywrite")
-        builder.add_edge("copywrite", "localize")
-        builder.add_edge("localize", "publish")
-        builder.add_edge("publish", END)  # type: ignore[arg-type]
+def _build_graph():  # pragma: no cover - exercised via integration path
+    builder = StateGraph(EnrichmentState)  # type: ignore[operator]
 
-        # Compile with LangSmith tracing if configured
-        compile_config = {}
-        if langsmith_configured:
-            compile_config["debug"] = True
+    builder.add_node("ingest", _node_ingest)
+    builder.add_node("extract", _node_extract)
+    builder.add_node("validate", _node_validate)
+    builder.add_node("copywrite", _node_copywrite)
+    builder.add_node("localize", _node_localize)
+    builder.add_node("publish", _node_publish)
 
-        _GRAPH = builder.compile(**compile_config)
+    builder.set_entry_point("ingest")
+    # extract and validate are independent, so they run in parallel and join at copywrite
+    builder.add_edge("ingest", "extract")
+    builder.add_edge("ingest", "validate")
+    builder.add_edge(["extract", "validate"], "copywrite")
+    builder.add_edge("copywrite", "localize")
+    builder.add_edge("localize", "publish")
+    builder.add_edge("publish", END)  # type: ignore[arg-type]
 
-        if langsmith_configured:
-            LOGGER.info("Graph compiled with LangSmith tracing enabled")
+    # Compile with LangSmith tracing if configured
+    compile_config = {}
+    if _LANGSMITH_CONFIGURED:
+        compile_config["debug"] = True
 
-    return _GRAPH
+    graph = builder.compile(**compile_config)
+
+    if _LANGSMITH_CONFIGURED:
+        LOGGER.info("Graph compiled with LangSmith tracing enabled")
+
+    return graph
+
+
+def _product(state: EnrichmentState) -> Mapping[str, Any]:
+    """Read-only view of the state's product: nodes share the caller's dict without copying it."""
+    return types.MappingProxyType(state["product"])
 
 
 def _node_ingest(state: EnrichmentState) -> EnrichmentState:
-    time.sleep(0.5)  # Artificial delay to make LangGraph orchestration visible
-    product = state["product"]
-    events = state.get("events", [])
+    if _DEBUG_DELAY:
+        time.sleep(_DEBUG_DELAY)
+    product = _product(state)
+    events: List[WorkflowEvent] = []
     events.append(
         WorkflowEvent(step="ingest", message="Loaded product", payload={"sku": product.get("sku")})
     )
@@ -171,27 +346,30 @@ def _node_ingest(state: EnrichmentState) -> EnrichmentState:
 
 
 def _node_extract(state: EnrichmentState) -> EnrichmentState:
-    time.sleep(0.7)  # Artificial delay to make LangGraph orchestration visible
-    product = state["product"]
-    events = state.get("events", [])
+    if _DEBUG_DELAY:
+        time.sleep(_DEBUG_DELAY)
+    product = _product(state)
+    events: List[WorkflowEvent] = []
     normalized = _normalize_attributes(product, events)
     LOGGER.info(f"[LangGraph] Extract node completed for SKU: {product.get('sku')}")
     return {"events": events, "normalized_attributes": normalized}
 
 
 def _node_validate(state: EnrichmentState) -> EnrichmentState:
-    time.sleep(0.6)  # Artificial delay to make LangGraph orchestration visible
-    product = state["product"]
-    events = state.get("events", [])
+    if _DEBUG_DELAY:
+        time.sleep(_DEBUG_DELAY)
+    product = _product(state)
+    events: List[WorkflowEvent] = []
     pricing = _validate_product(product, events)
     LOGGER.info(f"[LangGraph] Validate node completed for SKU: {product.get('sku')}")
     return {"events": events, "pricing": pricing}
 
 
 def _node_copywrite(state: EnrichmentState) -> EnrichmentState:
-    time.sleep(0.8)  # Artificial delay to make LangGraph orchestration visible
-    product = state["product"]
-    events = state.get("events", [])
+    if _DEBUG_DELAY:
+        time.sleep(_DEBUG_DELAY)
+    product = _product(state)
+    events: List[WorkflowEvent] = []
     normalized = state.get("normalized_attributes", {})
     seo = _build_seo_copy(product, normalized, events)
     LOGGER.info(f"[LangGraph] Copywrite node completed for SKU: {product.get('sku')}")
@@ -199,8 +377,9 @@ def _node_copywrite(state: EnrichmentState) -> EnrichmentState:
 
 
 def _node_localize(state: EnrichmentState) -> EnrichmentState:
-    time.sleep(0.4)  # Artificial delay to make LangGraph orchestration visible
-    events = state.get("events", [])
+    if _DEBUG_DELAY:
+        time.sleep(_DEBUG_DELAY)
+    events: List[WorkflowEvent] = []
     seo = state.get("seo", {})
     localizations = _localize_copy(seo, events)
     LOGGER.info("[LangGraph] Localize node completed")
@@ -208,9 +387,10 @@ def _node_localize(state: EnrichmentState) -> EnrichmentState:
 
 
 def _node_publish(state: EnrichmentState) -> EnrichmentState:
-    time.sleep(0.3)  # Artificial delay to make LangGraph orchestration visible
-    product = state["product"]
-    events = state.get("events", [])
+    if _DEBUG_DELAY:
+        time.sleep(_DEBUG_DELAY)
+    product = _product(state)
+    events: List[WorkflowEvent] = []
     normalized = state.get("normalized_attributes", {})
     seo = state.get("seo", {})
     localizations = state.get("localizations", [])
@@ -247,56 +427,39 @@ def _normalize_attributes(product: Dict[str, Any], events: List[WorkflowEvent])
 
 def _ai_extract_attributes(product: Dict[str, Any], events: List[WorkflowEvent], client) -> Dict[str, Any]:
     """Use OpenAI to intelligently extract and normalize product attributes."""
-    prompt = f"""
-    Analyze this product and extract structured attributes. Focus on key product characteristics that would be useful for e-commerce:
-
-    Product Name: {product.get('name', '')}
-    Description: {product.get('description', '')}
-    Category: {product.get('category', '')}
-    Existing Attributes: {product.get('attributes', {})}
-
-    Extract and normalize the following types of attributes when applicable:
-    - Physical properties (color, size, weight, dimensions)
-    - Material and composition
-    - Technical specifications
-    - Style and design features
-    - Compatibility information
-    - Usage characteristics
-
-    Return a JSON object with normalized attribute names (lowercase, underscore-separated) and clear values.
-    Include a confidence score (0-1) for each extracted attribute.
-    """
+    prompt = _EXTRACT_PROMPT.format(
+        name=product.get("name", ""),
+        description=product.get("description", ""),
+        category=product.get("category", ""),
+        attributes=product.get("attributes", {}),
+    )
 
     try:
-        response = client.chat.completions.create(
-            model="gpt-3.5-turbo",
+        extracted, tokens = cached_json_completion(
+            client,
+            model=_OPENAI_MODEL,
+            response_format=_JSON_RESPONSE_FORMAT,
             messages=[
-                {"role": "system", "content": "You are an expert product data analyst. Extract structured product attributes from product information. Respond only with valid JSON."},
+                {"role": "system", "content": _EXTRACT_SYSTEM},
                 {"role": "user", "content": prompt}
             ],
             temperature=0.1,
             max_tokens=500
         )
 
-        import json as json_lib
-        extracted = json_lib.loads(response.choices[0].message.content)
-        events.append(WorkflowEvent(step="extract", message="AI extracted product attributes", payload={"token_usage": response.usage.total_tokens}))
-
-        # Merge with existing attributes and add category
-        normalized = extracted.copy()
-        normalized["category"] = product.get("category", "uncategorized").lower()
-
-        # Apply unit conversions
-        for key, value in normalized.items():
-            normalized[key] = _convert_units(key, value)
-
-        return normalized
-
-    except Exception as e:
+    except _AI_ERRORS as e:
         LOGGER.error(f"AI attribute extraction failed: {e}")
         events.append(WorkflowEvent(step="extract", message=f"AI extraction failed: {str(e)}, using fallback"))
         return _fallback_extract_attributes(product, events)
 
+    events.append(WorkflowEvent(step="extract", message="AI extracted product attributes", payload={"token_usage": tokens}))
+
+    # Merge with existing attributes and add category
+    extracted["category"] = product.get("category", "uncategorized").lower()
+
+    # Apply unit conversions
+    return {key: _convert_units(key, value) for key, value in extracted.items()}
+
 
 def _fallback_extract_attributes(product: Dict[str, Any], events: List[WorkflowEvent]) -> Dict[str, Any]:
     """Fallback attribute extraction without AI."""
@@ -314,22 +477,15 @@ def _fallback_extract_attributes(product: Dict[str, Any], events: List[WorkflowE
 def _convert_units(key: str, value: Any) -> Any:
     if not isinstance(value, str):
         return value
-    lower = value.lower()
-    if key in {"capacity", "volume"} and "oz" in lower:
-        try:
-            ounces = float(lower.split("oz")[0].strip())
-        except ValueError:
-            return value
-        milliliters = round(ounces * 29.5735, 2)
-        return {"value": milliliters, "unit": "ml", "source": value}
-    if key in {"weight"} and "lb" in lower:
-        try:
-            pounds = float(lower.split("lb")[0].strip())
-        except ValueError:
-            return value
-        kilograms = round(pounds * 0.453592, 2)
-        return {"value": kilograms, "unit": "kg", "source": value}
-    return value
+    match = _NUM_UNIT_RE.match(value.lower())
+    if match is None:
+        return value
+    amount, unit = match.groups()
+    conversion = _CONVERSIONS.get((key, unit))
+    if conversion is None:
+        return value
+    factor, target_unit = conversion
+    return {"value": round(float(amount) * factor, 2), "unit": target_unit, "source": value}
 
 
 def _validate_product(product: Dict[str, Any], events: List[WorkflowEvent]) -> Dict[str, Any]:
@@ -355,57 +511,36 @@ def _build_seo_copy(product: Dict[str, Any], normalized: Dict[str, Any], events:
 
 def _ai_generate_seo_copy(product: Dict[str, Any], normalized: Dict[str, Any], events: List[WorkflowEvent], client) -> Dict[str, Any]:
     """Use OpenAI to generate compelling SEO copy."""
-    prompt = f"""
-    Create compelling SEO-optimized copy for this e-commerce product:
-
-    Product Name: {product.get('name', '')}
-    Description: {product.get('description', '')}
-    Category: {product.get('category', '')}
-    Price: ${product.get('price', '')} {product.get('currency', 'USD')}
-    Key Attributes: {dict(list(normalized.items())[:5])}  # First 5 attributes
-
-    Generate:
-    1. SEO Title (50-60 chars): Compelling, keyword-rich page title
-    2. Meta Description (150-160 chars): Engaging description that drives clicks
-    3. Keywords (5-10): Relevant search terms for this product
-
-    Focus on:
-    - Benefits and unique features
-    - Target customer intent
-    - Natural keyword integration
-    - Compelling calls to action
-
-    Return JSON format:
-    {{
-        "title": "SEO title here",
-        "description": "Meta description here",
-        "keywords": ["keyword1", "keyword2", "keyword3"],
-        "long_description": "Detailed product description for product pages"
-    }}
-    """
+    prompt = _SEO_PROMPT.format(
+        name=product.get("name", ""),
+        description=product.get("description", ""),
+        category=product.get("category", ""),
+        price=product.get("price", ""),
+        currency=product.get("currency", "USD"),
+        attributes=dict(list(normalized.items())[:5]),  # First 5 attributes
+    )
 
     try:
-        response = client.chat.completions.create(
-            model="gpt-3.5-turbo",
+        seo_copy, tokens = cached_json_completion(
+            client,
+            model=_OPENAI_MODEL,
+            response_format=_JSON_RESPONSE_FORMAT,
             messages=[
-                {"role": "system", "content": "You are an expert SEO copywriter specializing in e-commerce product optimization. Create compelling, conversion-focused copy that ranks well and drives sales. Respond only with valid JSON."},
+                {"role": "system", "content": _SEO_SYSTEM},
                 {"role": "user", "content": prompt}
             ],
             temperature=0.3,
             max_tokens=600
         )
 
-        import json as json_lib
-        seo_copy = json_lib.loads(response.choices[0].message.content)
-        events.append(WorkflowEvent(step="copywrite", message="AI generated SEO copy", payload={"token_usage": response.usage.total_tokens}))
-
-        return seo_copy
-
-    except Exception as e:
+    except _AI_ERRORS as e:
         LOGGER.error(f"AI SEO generation failed: {e}")
         events.append(WorkflowEvent(step="copywrite", message=f"AI SEO failed: {str(e)}, using fallback"))
         return _fallback_seo_copy(product, normalized, events)
 
+    events.append(WorkflowEvent(step="copywrite", message="AI generated SEO copy", payload={"token_usage": tokens}))
+    return seo_copy
+
 
 def _fallback_seo_copy(product: Dict[str, Any], normalized: Dict[str, Any], events: List[WorkflowEvent]) -> Dict[str, Any]:
     """Fallback SEO copy generation without AI."""
@@ -446,117 +581,194 @@ def _ai_localize_copy(seo_copy: Dict[str, Any], events: List[WorkflowEvent], cli
         "long_description": base_copy.get("long_description", "")
     })
 
-    # Generate other locales with AI
-    for locale in target_locales[1:]:  # Skip en-US
-        try:
-            locale_name = {"es-ES": "Spanish", "fr-FR": "French"}.get(locale, locale)
-
-            prompt = f"""
-            Translate and localize this e-commerce product copy to {locale_name}.
-            Adapt the content for {locale_name} market preferences and cultural context:
-
-            Original Title: {base_copy['title']}
-            Original Description: {base_copy['description']}
-            Long Description: {base_copy.get('long_description', 'N/A')}
-
-            Requirements:
-            - Maintain SEO effectiveness
-            - Adapt cultural references and selling points
-            - Keep character limits similar to original
-            - Use natural, native-sounding language
-            - Preserve key product information
-
-            Return JSON format:
-            {{
-                "title": "Translated title",
-                "description": "Translated description",
-                "long_description": "Translated long description"
-            }}
-            """
-
-            response = client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": f"You are an expert translator and localizer specializing in e-commerce copy for {locale_name} markets. Provide culturally appropriate, SEO-optimized translations. Respond only with valid JSON."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.2,
-                max_tokens=400
-            )
-
-            import json as json_lib
-            translated = json_lib.loads(response.choices[0].message.content)
-
-            localizations.append({
-                "locale": locale,
-                "title": translated.get("title", ""),
-                "description": translated.get("description", ""),
-                "long_description": translated.get("long_description", "")
-            })
-
-            events.append(WorkflowEvent(step="localize", message=f"AI localized to {locale_name}", payload={"token_usage": response.usage.total_tokens}))
-
-        except Exception as e:
-            LOGGER.error(f"AI localization failed for {locale}: {e}")
-            events.append(WorkflowEvent(step="localize", message=f"Localization failed for {locale}: {str(e)}"))
+    # Generate other locales with AI: one request for all of them, per-locale requests if that fails
+    ai_locales = target_locales[1:]  # Skip en-US
+    translations = _ai_localize_batch(base_copy, ai_locales, events, client)
+    if translations is None:
+        translations = _ai_localize_per_locale(base_copy, ai_locales, events, client)
+
+    for locale in ai_locales:
+        translated = translations.get(locale)
+        if translated is None:
+            continue
+        localizations.append({
+            "locale": locale,
+            "title": translated.get("title", ""),
+            "description": translated.get("description", ""),
+            "long_description": translated.get("long_description", "")
+        })
 
     return localizations
 
 
+def _ai_localize_batch(base_copy: Dict[str, Any], locales: List[str], events: List[WorkflowEvent], client) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Translate ``base_copy`` into every locale with a single request.
+
+    Returns translations keyed by locale, or ``None`` when the request fails or
+    the response doesn't contain an object for each requested locale.
+    """
+    locale_names = [_LOCALE_NAMES.get(locale, locale) for locale in locales]
+    locale_list = "\n".join(f"- {locale} ({name})" for locale, name in zip(locales, locale_names))
+    prompt = _LOCALIZE_BATCH_PROMPT.format(
+        locale_list=locale_list,
+        title=base_copy["title"],
+        description=base_copy["description"],
+        long_description=base_copy.get("long_description", "N/A"),
+        first_locale=locales[0],
+    )
+
+    try:
+        translations, tokens = cached_json_completion(
+            client,
+            model=_OPENAI_MODEL,
+            response_format=_JSON_RESPONSE_FORMAT,
+            messages=[
+                {"role": "system", "content": _LOCALIZE_SYSTEM.format(markets=", ".join(locale_names))},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.2,
+            max_tokens=400 * len(locales),
+            # Checked before caching, so an incomplete reply isn't replayed on every run
+            validate=lambda reply: _require_locales(reply, locales),
+        )
+
+    except _AI_ERRORS as e:
+        LOGGER.warning(f"Batched AI localization failed: {e}")
+        events.append(WorkflowEvent(step="localize", message=f"Batched localization failed: {str(e)}, retrying per locale"))
+        return None
+
+    events.append(WorkflowEvent(step="localize", message=f"AI localized to {', '.join(locale_names)}", payload={"token_usage": tokens}))
+    return translations
+
+
+def _require_locales(translations: Any, locales: List[str]) -> None:
+    """Raise ``ValueError`` unless ``translations`` holds an object for every locale."""
+    if not isinstance(translations, dict):
+        raise ValueError("response is not a JSON object")
+    missing = [locale for locale in locales if not isinstance(translations.get(locale), dict)]
+    if missing:
+        raise ValueError(f"response missing locales: {', '.join(missing)}")
+
+
+def _ai_localize_per_locale(base_copy: Dict[str, Any], locales: List[str], events: List[WorkflowEvent], client) -> Dict[str, Dict[str, Any]]:
+    """Translate ``base_copy`` with one concurrent request per locale, skipping locales that fail."""
+    results = parallel_map(lambda locale: _ai_translate_locale(base_copy, locale, client), locales, max_workers=len(locales) or 1)
+    translations: Dict[str, Dict[str, Any]] = {}
+    for locale, (translated, event) in zip(locales, results):
+        events.append(event)
+        if translated is not None:
+            translations[locale] = translated
+    return translations
+
+
+def _ai_translate_locale(base_copy: Dict[str, Any], locale: str, client) -> Tuple[Optional[Dict[str, Any]], WorkflowEvent]:
+    """Translate ``base_copy`` into a single locale, returning the translation (or ``None``) and its event."""
+    locale_name = _LOCALE_NAMES.get(locale, locale)
+    try:
+        prompt = _LOCALIZE_PROMPT.format(
+            locale_name=locale_name,
+            title=base_copy["title"],
+            description=base_copy["description"],
+            long_description=base_copy.get("long_description", "N/A"),
+        )
+
+        translated, tokens = cached_json_completion(
+            client,
+            model=_OPENAI_MODEL,
+            response_format=_JSON_RESPONSE_FORMAT,
+            messages=[
+                {"role": "system", "content": _LOCALIZE_SYSTEM.format(markets=locale_name)},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.2,
+            max_tokens=400
+        )
+        return translated, WorkflowEvent(step="localize", message=f"AI localized to {locale_name}", payload={"token_usage": tokens})
+
+    except _AI_ERRORS as e:
+        LOGGER.error(f"AI localization failed for {locale}: {e}")
+        return None, WorkflowEvent(step="localize", message=f"Localization failed for {locale}: {str(e)}")
+
+
 def _fallback_localize_copy(seo_copy: Dict[str, Any], events: List[WorkflowEvent]) -> List[Dict[str, Any]]:
     """Fallback localization without AI."""
     events.append(WorkflowEvent(step="localize", message="Generated default locale copy"))
     return [{"locale": "en-US", "title": seo_copy.get("title", ""), "description": seo_copy.get("description", "")}]
 
 
-def _run_sequential_pipeline(product: Dict[str, Any]) -> EnrichmentState:
+def _emit_new_events(events: List[WorkflowEvent], emitted: int, on_event: Optional[Callable[[WorkflowEvent], None]]) -> int:
+    """Forward events recorded since ``emitted`` to ``on_event`` and return the new count."""
+    if on_event is not None:
+        for event in events[emitted:]:
+            on_event(event)
+    return len(events)
+
+
+def _run_sequential_pipeline(product: Dict[str, Any], on_event: Optional[Callable[[WorkflowEvent], None]] = None) -> EnrichmentState:
     events: List[WorkflowEvent] = []
     state: EnrichmentState = {"product": product, "events": events}
-    _node_ingest(state)
-    state.update(_node_extract(state))
-    state.update(_node_validate(state))
-    state.update(_node_copywrite(state))
-    state.update(_node_localize(state))
-    state.update(_node_publish(state))
+    emitted = 0
+    for node in (_node_ingest, _node_extract, _node_validate, _node_copywrite, _node_localize, _node_publish):
+        update = node(state)
+        events.extend(update.pop("events", []))
+        state.update(update)
+        emitted = _emit_new_events(events, emitted, on_event)
     return state
 
 
-def enrich_product(product: Dict[str, Any]) -> ProcessedProduct:
+def _stream_graph(graph, state: EnrichmentState, config: Optional[Dict[str, Any]], on_event: Callable[[WorkflowEvent], None]) -> EnrichmentState:
+    """Run the graph step by step, forwarding events as each node completes."""
+    result = state
+    emitted = 0
+    for result in graph.stream(state, config=config, stream_mode="values"):
+        emitted = _emit_new_events(result.get("events", []), emitted, on_event)
+    return result
+
+
+def enrich_product(product: Dict[str, Any], on_event: Optional[Callable[[WorkflowEvent], None]] = None) -> ProcessedProduct:
+    """Run the enrichment workflow for ``product``.
+
+    ``on_event`` is called with each workflow event as soon as the node that
+    produced it finishes, which lets callers stream progress while the
+    pipeline is still running.
+    """
     start_time = time.time()
     sku = product.get("sku", "UNKNOWN")
 
     if LANGGRAPH_AVAILABLE:
         LOGGER.info(f"[LangGraph] Starting enrichment for SKU: {sku}")
-        langsmith_configured = os.getenv("LANGSMITH_API_KEY") is not None
-        if langsmith_configured:
+        if _LANGSMITH_CONFIGURED:
             LOGGER.info(f"[LangSmith] Tracing enabled for SKU: {sku}")
 
         graph = _get_graph()
         state: EnrichmentState = {
+            # Kept a plain dict so LangSmith traces record it as structured input
             "product": product,
             "events": [],
         }
 
-        # Run with LangSmith tracing if configured
-        if langsmith_configured and langsmith is not None:
-            # Use run_name for better trace identification
-            run_name = f"enrich_product_{sku}_{int(time.time())}"
-            result: EnrichmentState = graph.invoke(
-                state,
-                config={"run_name": run_name, "metadata": {"sku": sku}}
-            )  # type: ignore[attr-defined]
+        # Run with LangSmith tracing if configured; LangSmith timestamps runs itself
+        config = None
+        if _LANGSMITH_CONFIGURED:
+            config = {"run_name": f"enrich_{sku}", "metadata": {"sku": sku}}
+
+        if on_event is None:
+            result: EnrichmentState = graph.invoke(state, config=config)  # type: ignore[attr-defined]
         else:
-            result: EnrichmentState = graph.invoke(state)  # type: ignore[attr-defined]
+            result = _stream_graph(graph, state, config, on_event)
 
         duration = time.time() - start_time
         LOGGER.info(f"[LangGraph] Completed enrichment for SKU: {sku} in {duration:.2f}s")
     else:
         LOGGER.info(f"[Sequential] Starting enrichment for SKU: {sku}")
-        result = _run_sequential_pipeline(product)
+        result = _run_sequential_pipeline(product, on_event)
         duration = time.time() - start_time
         LOGGER.info(f"[Sequential] Completed enrichment for SKU: {sku} in {duration:.2f}s")
 
     events = result.get("events", [])
+    if len(events) > _MAX_EVENTS:
+        # Not events[-_MAX_EVENTS:], which would keep everything when the cap is 0
+        events = events[len(events) - _MAX_EVENTS:]
     enriched = result.get("enriched")
     if not enriched:
         raise RuntimeError("Enrichment failed to produce output")
@@ -569,30 +781,54 @@ def enrich_product(product: Dict[str, Any]) -> ProcessedProduct:
     )
 
 
-def process_pending_products(simple_path: str, enriched_path: str, *, process_all: bool = False) -> List[ProcessedProduct]:
-    """Load catalog files, process new products, and persist enriched results."""
+def process_pending_products(
+    simple_path: str, enriched_path: str, *, process_all: bool = False, persist: bool = True
+) -> List[ProcessedProduct]:
+    """Load catalog files, process new products, and persist enriched results.
+
+    New records are spliced onto the end of the enriched catalog, so the
+    existing file is never rewritten; ``persist=False`` writes nothing, not
+    even the catalog's ``.idx`` key sidecar.
+    """
     simple_records = load_json_array(Path(simple_path))
-    enriched_records = load_json_array(Path(enriched_path))
-
-    existing_skus = {record.get("sku") for record in enriched_records}
-    pending = [record for record in simple_records if record.get("sku") not in existing_skus]
-    if not process_all and pending:
-        pending = [pending[-1]]
-
-    processed: List[ProcessedProduct] = []
-    for product in pending:
-        try:
-            result = enrich_product(product)
-            processed.append(result)
+    # Read from the enriched catalog's .idx sidecar when current, so the (large) array isn't parsed
+    existing_skus = load_keys(Path(enriched_path), "sku", write_index=persist)
+
+    if process_all:
+        pending = [record for record in simple_records if record.get("sku") not in existing_skus]
+    else:
+        # Only the newest pending product is needed: scan from the end and stop at the first hit
+        pending = next(
+            ([record] for record in reversed(simple_records) if record.get("sku") not in existing_skus),
+            [],
+        )
+
+    # Enrich up to ENRICH_CONCURRENCY products at once; results keep the catalog order
+    completed: Dict[int, ProcessedProduct] = {}
+    with ThreadPoolExecutor(max_workers=_ENRICH_CONCURRENCY) as executor:
+        futures = {executor.submit(enrich_product, product): index for index, product in enumerate(pending)}
+        for future in as_completed(futures):
+            product = pending[futures[future]]
+            try:
+                result = future.result()
+            except Exception as exc:  # pragma: no cover - defensive logging
+                LOGGER.exception("Failed to process product %s: %s", product.get("sku"), exc)
+                continue
+            completed[futures[future]] = result
             LOGGER.info("Processed product %s", result.sku)
-        except Exception as exc:  # pragma: no cover - defensive logging
-            LOGGER.exception("Failed to process product %s: %s", product.get("sku"), exc)
+    processed = [completed[index] for index in sorted(completed)]
 
-    if processed:
+    if processed and persist:
         append_unique_records(
             Path(enriched_path),
-            existing=enriched_records,
             new_records=(result.enriched for result in processed),
             key="sku",
         )
     return processed
+
+
+# Opt-in warmup so the first request does not pay for client creation and graph compilation
+if os.getenv("ENRICHMENT_EAGER_INIT"):
+    _get_openai_client()
+    if LANGGRAPH_AVAILABLE:
+        _get_graph()
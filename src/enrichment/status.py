@@ -6,17 +6,23 @@ from datetime import datetime, timezone
 from typing import Any, Dict
 
 
-@dataclass
+def _utc_timestamp() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+@dataclass(frozen=True, slots=True)
 class WorkflowEvent:
     step: str
     message: str
-    payload: Dict[str, Any] | None = None
-    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    # Always a dict, so orjson can encode the event itself with the same shape as as_dict()
+    payload: Dict[str, Any] = field(default_factory=dict)
+    # ISO-8601 string captured at creation, so serializing an event never re-formats it
+    timestamp: str = field(default_factory=_utc_timestamp)
 
     def as_dict(self) -> Dict[str, Any]:
         return {
             "step": self.step,
             "message": self.message,
-            "payload": self.payload or {},
-            "timestamp": self.timestamp.isoformat(),
+            "payload": self.payload,
+            "timestamp": self.timestamp,
         }
@@ -1,10 +1,49 @@
 from __future__ import annotations
 
+import os
 import sys
 from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
 
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 
-if str(SRC) not in sys.path:
-    sys.path.insert(0, str(SRC))
+for path in (SRC, ROOT):  # `enrichment` for the pipeline tests, `src.api` for the API tests
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+# Tests script their own OpenAI replies; never serve them from a cache left by another run
+os.environ.setdefault("ENRICHMENT_NO_CACHE", "1")
+
+
+class StubCompletions:
+    """Fake ``chat.completions`` that records each request and replays scripted replies.
+
+    A reply may be a string or a callable taking the request kwargs; the last
+    reply is repeated once the earlier ones are used up.
+    """
+
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.calls = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        reply = self.replies.pop(0) if len(self.replies) > 1 else self.replies[0]
+        content = reply(kwargs) if callable(reply) else reply
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=SimpleNamespace(total_tokens=42),
+        )
+
+
+@pytest.fixture()
+def stub_client():
+    """Build a fake OpenAI client from ``*replies``; see ``StubCompletions``."""
+
+    def make(*replies):
+        return SimpleNamespace(chat=SimpleNamespace(completions=StubCompletions(replies)))
+
+    return make
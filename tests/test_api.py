@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api import main
+
+
+@pytest.fixture()
+def catalogs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> tuple[Path, Path]:
+    simple = tmp_path / "simple.json"
+    enriched = tmp_path / "enriched.json"
+    simple.write_text("[]\n", encoding="utf-8")
+    enriched.write_text("[]\n", encoding="utf-8")
+    monkeypatch.setattr(main, "SIMPLE_PATH", simple)
+    monkeypatch.setattr(main, "ENRICHED_PATH", enriched)
+    monkeypatch.setattr(main, "ENRICH_WORKERS", 1)
+    # Only the threshold and the lifespan exit flush during a test
+    monkeypatch.setattr(main, "FLUSH_INTERVAL", 60)
+    return simple, enriched
+
+
+def _enrich(client: TestClient, sku: str) -> None:
+    response = client.post("/api/enrich", json={"sku": sku, "name": "Mug", "description": "Ceramic.", "price": 8.0})
+    assert response.status_code == 200
+
+
+def _skus(path: Path) -> list[str]:
+    return [record["sku"] for record in json.loads(path.read_text(encoding="utf-8"))]
+
+
+def test_buffered_save_is_readable_before_flush(catalogs: tuple[Path, Path]):
+    simple, enriched = catalogs
+
+    with TestClient(main.app) as client:
+        _enrich(client, "API-1")
+        assert _skus(enriched) == []
+
+        response = client.get("/api/products/API-1")
+
+    assert response.status_code == 200
+    assert response.json()["simple"]["sku"] == "API-1"
+    assert response.json()["enriched"]["sku"] == "API-1"
+
+
+def test_reaching_flush_threshold_writes_buffered_records(catalogs: tuple[Path, Path], monkeypatch: pytest.MonkeyPatch):
+    simple, enriched = catalogs
+    monkeypatch.setattr(main, "FLUSH_THRESHOLD", 2)
+
+    with TestClient(main.app) as client:
+        _enrich(client, "API-1")
+        assert _skus(simple) == []
+        _enrich(client, "API-2")
+
+        assert _skus(simple) == ["API-1", "API-2"]
+        assert _skus(enriched) == ["API-1", "API-2"]
+        assert main.PENDING_SIMPLE == [] and main.PENDING_ENRICHED == []
+
+
+def test_lifespan_exit_flushes_each_record_exactly_once(catalogs: tuple[Path, Path]):
+    simple, enriched = catalogs
+
+    with TestClient(main.app) as client:
+        _enrich(client, "API-1")
+
+    for path in (simple, enriched):
+        assert path.read_bytes().count(b'"sku": "API-1"') == 1
+        assert _skus(path) == ["API-1"]
+    assert main.PENDING_SIMPLE == [] and main.PENDING_ENRICHED == []
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from enrichment import catalog_io
+from enrichment.catalog_io import append_unique_records, load_index, load_json_array, load_keys, write_json_array
+
+
+def test_load_json_array_reuses_parsed_list_until_file_changes(tmp_path: Path):
+    catalog = tmp_path / "catalog.json"
+    catalog.write_text('[{"sku": "A"}]\n', encoding="utf-8")
+
+    first = load_json_array(catalog)
+    assert load_json_array(catalog) is first
+
+    catalog.write_text('[{"sku": "A"}, {"sku": "B"}]\n', encoding="utf-8")
+    assert [record["sku"] for record in load_json_array(catalog)] == ["A", "B"]
+
+
+def test_write_json_array_refreshes_cache(tmp_path: Path):
+    catalog = tmp_path / "catalog.json"
+    write_json_array(catalog, [{"sku": "A"}])
+    load_json_array(catalog)
+
+    write_json_array(catalog, [{"sku": "A"}, {"sku": "B"}])
+
+    assert [record["sku"] for record in load_json_array(catalog)] == ["A", "B"]
+    assert catalog.read_text(encoding="utf-8") == '[\n  {\n    "sku": "A"\n  },\n  {\n    "sku": "B"\n  }\n]\n'
+
+
+def test_load_json_array_missing_file_returns_empty_list(tmp_path: Path):
+    assert load_json_array(tmp_path / "missing.json") == []
+
+
+def test_append_unique_records_splices_new_records_only(tmp_path: Path):
+    catalog = tmp_path / "catalog.json"
+    catalog.write_text("[]", encoding="utf-8")
+
+    appended = append_unique_records(catalog, new_records=[{"sku": "A"}, {"sku": "A"}], key="sku")
+    assert appended == [{"sku": "A"}]
+
+    appended = append_unique_records(catalog, new_records=[{"sku": "A"}, {"sku": "B", "tags": ["x"]}], key="sku")
+    assert appended == [{"sku": "B", "tags": ["x"]}]
+
+    expected = tmp_path / "expected.json"
+    write_json_array(expected, [{"sku": "A"}, {"sku": "B", "tags": ["x"]}])
+    assert catalog.read_bytes() == expected.read_bytes()
+    assert load_json_array(catalog) == [{"sku": "A"}, {"sku": "B", "tags": ["x"]}]
+    assert catalog.with_suffix(".idx").exists()
+
+
+def test_append_unique_records_rescans_when_catalog_changes(tmp_path: Path):
+    catalog = tmp_path / "catalog.json"
+    append_unique_records(catalog, new_records=[{"sku": "A"}], key="sku")
+
+    write_json_array(catalog, [{"sku": "A"}, {"sku": "B"}])
+
+    assert append_unique_records(catalog, new_records=[{"sku": "B"}], key="sku") == []
+    assert [record["sku"] for record in load_json_array(catalog)] == ["A", "B"]
+
+
+def test_load_index_keys_records_and_follows_file_changes(tmp_path: Path):
+    catalog = tmp_path / "catalog.json"
+    write_json_array(catalog, [{"sku": "A", "n": 1}, {"sku": "A", "n": 2}, {"name": "no sku"}])
+
+    index = load_index(catalog, "sku")
+    assert index == {"A": {"sku": "A", "n": 1}}
+    assert load_index(catalog, "sku") is index
+
+    append_unique_records(catalog, new_records=[{"sku": "B"}], key="sku")
+    assert set(load_index(catalog, "sku")) == {"A", "B"}
+
+
+def test_load_json_array_parses_large_files_via_mmap(tmp_path: Path):
+    catalog = tmp_path / "catalog.json"
+    records = [{"sku": f"SKU-{index}", "description": "x" * 100} for index in range(1000)]
+    catalog.write_text(json.dumps(records), encoding="utf-8")
+    assert catalog.stat().st_size > 64 * 1024
+
+    assert load_json_array(catalog) == records
+
+
+def test_load_keys_writes_sidecar_so_later_runs_skip_parsing(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    catalog = tmp_path / "catalog.json"
+    catalog.write_text(json.dumps([{"sku": "A"}, {"sku": "B"}, {"name": "no sku"}]), encoding="utf-8")
+
+    assert load_keys(catalog, "sku") == {"A", "B"}
+    assert catalog.with_suffix(".idx").exists()
+
+    # A fresh process has no in-memory caches and must not need the array itself
+    monkeypatch.setattr(catalog_io, "_KEYS_CACHE", {})
+    monkeypatch.setattr(catalog_io, "load_json_array", lambda path: pytest.fail("catalog was parsed"))
+    assert load_keys(catalog, "sku") == {"A", "B"}
+
+
+def test_append_unique_records_survives_unwritable_sidecar(tmp_path: Path):
+    catalog = tmp_path / "catalog.json"
+    write_json_array(catalog, [{"sku": "A"}])
+    # A directory where the sidecar's temp file would go makes the index write fail
+    catalog.with_suffix(".idx.tmp").mkdir()
+
+    assert append_unique_records(catalog, new_records=[{"sku": "B"}], key="sku") == [{"sku": "B"}]
+
+    assert [record["sku"] for record in json.loads(catalog.read_text(encoding="utf-8"))] == ["A", "B"]
+    assert append_unique_records(catalog, new_records=[{"sku": "B"}], key="sku") == []
+
+
+def test_append_unique_records_trims_old_tail_after_splicing(tmp_path: Path):
+    catalog = tmp_path / "catalog.json"
+    # Trailing whitespace longer than the spliced body must not survive past the new end
+    catalog.write_text('[{"sku": "A"}]' + " " * 200 + "\n", encoding="utf-8")
+
+    append_unique_records(catalog, new_records=[{"sku": "B"}], key="sku")
+
+    assert catalog.read_bytes().endswith(b"}\n]\n")
+    assert [record["sku"] for record in json.loads(catalog.read_text(encoding="utf-8"))] == ["A", "B"]
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import ast
+import threading
+from pathlib import Path
+
+import pytest
+
+from enrichment.concurrency import parallel_map
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_parallel_map_preserves_order_and_overlaps_calls():
+    barrier = threading.Barrier(4, timeout=5)
+
+    def work(value: int) -> int:
+        barrier.wait()  # only passes if all four calls are in flight together
+        return value * 2
+
+    assert parallel_map(work, [1, 2, 3, 4], max_workers=4) == [2, 4, 6, 8]
+
+
+def test_parallel_map_propagates_errors():
+    def work(value: int) -> int:
+        if value == 2:
+            raise ValueError("boom")
+        return value
+
+    with pytest.raises(ValueError, match="boom"):
+        parallel_map(work, [1, 2, 3])
+
+
+def _calls_method(node: ast.AST, name: str) -> bool:
+    return any(
+        isinstance(child, ast.Call) and isinstance(child.func, ast.Attribute) and child.func.attr == name
+        for child in ast.walk(node)
+    )
+
+
+def test_no_loop_submits_and_waits_on_futures_in_the_same_iteration():
+    offenders = []
+    for path in [*(ROOT / "src").rglob("*.py"), *(ROOT / "scripts").rglob("*.py")]:
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.For, ast.AsyncFor, ast.While)):
+                body = ast.Module(body=node.body, type_ignores=[])
+                if _calls_method(body, "submit") and _calls_method(body, "result"):
+                    offenders.append(f"{path.relative_to(ROOT)}:{node.lineno}")
+
+    assert not offenders, f"Loop submits work and blocks on .result() each iteration: {offenders}"
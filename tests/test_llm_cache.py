@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from enrichment import llm_cache
+
+
+@pytest.fixture()
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(llm_cache, "_DISABLED", False)
+    monkeypatch.setattr(llm_cache, "_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(llm_cache, "_MEMORY", llm_cache.OrderedDict())
+    return tmp_path
+
+
+def test_cached_json_completion_reuses_identical_requests(cache_dir: Path, stub_client):
+    client = stub_client(json.dumps({"title": "Mug"}))
+    request = {"model": "m", "messages": [{"role": "user", "content": "hi"}], "temperature": 0.1}
+
+    first = llm_cache.cached_json_completion(client, **request)
+    second = llm_cache.cached_json_completion(client, **request)
+    other = llm_cache.cached_json_completion(client, **{**request, "temperature": 0.2})
+
+    assert first == ({"title": "Mug"}, 42)
+    assert second == ({"title": "Mug"}, 0)
+    assert other[1] == 42
+    assert len(client.chat.completions.calls) == 2
+    assert second[0] is not first[0]
+
+
+def test_cached_json_completion_reads_disk_cache_from_previous_run(cache_dir: Path, stub_client, monkeypatch: pytest.MonkeyPatch):
+    llm_cache.cached_json_completion(stub_client('{"a": 1}'), model="m", messages=[])
+    monkeypatch.setattr(llm_cache, "_MEMORY", llm_cache.OrderedDict())
+
+    client = stub_client('{"a": 2}')
+    assert llm_cache.cached_json_completion(client, model="m", messages=[]) == ({"a": 1}, 0)
+    assert len(client.chat.completions.calls) == 0
+
+
+def test_cached_json_completion_does_not_store_invalid_replies(cache_dir: Path, stub_client):
+    with pytest.raises(ValueError):
+        llm_cache.cached_json_completion(stub_client("not json"), model="m", messages=[])
+
+    assert list(cache_dir.iterdir()) == []
+
+
+def _require_title(reply):
+    if "title" not in reply:
+        raise ValueError("missing title")
+
+
+def test_cached_json_completion_does_not_store_replies_rejected_by_validate(cache_dir: Path, stub_client):
+    client = stub_client('{"other": 1}')
+
+    with pytest.raises(ValueError):
+        llm_cache.cached_json_completion(client, validate=_require_title, model="m", messages=[])
+
+    assert list(cache_dir.iterdir()) == []
+    assert llm_cache._MEMORY == {}
+
+
+def test_cached_json_completion_refetches_cached_reply_that_fails_validate(cache_dir: Path, stub_client):
+    llm_cache.cached_json_completion(stub_client('{"other": 1}'), model="m", messages=[])
+
+    client = stub_client('{"title": "Mug"}')
+    reply = llm_cache.cached_json_completion(client, validate=_require_title, model="m", messages=[])
+
+    assert reply == ({"title": "Mug"}, 42)
+    assert len(client.chat.completions.calls) == 1
+    assert llm_cache.cached_json_completion(client, validate=_require_title, model="m", messages=[])[1] == 0
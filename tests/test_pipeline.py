@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import json
+import threading
 from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 
-from enrichment.pipeline import enrich_product, process_pending_products
+from enrichment import pipeline
+from enrichment.pipeline import _ai_extract_attributes, _ai_localize_copy, enrich_product, process_pending_products
 
 
 @pytest.fixture()
@@ -52,6 +55,53 @@ def test_enrich_product_converts_capacity_units():
     assert result.enriched["seo"]["title"].startswith("Bottle | ")
 
 
+def test_enrich_product_hands_nodes_a_read_only_product(monkeypatch: pytest.MonkeyPatch):
+    seen = []
+    validate = pipeline._validate_product
+
+    def capture(product, events):
+        seen.append(product)
+        return validate(product, events)
+
+    monkeypatch.setattr(pipeline, "_validate_product", capture)
+    product = {"sku": "TEMP-3", "name": "Mug", "price": 8.0, "category": "Kitchen"}
+
+    result = enrich_product(product)
+
+    assert isinstance(seen[0], MappingProxyType)
+    with pytest.raises(TypeError):
+        seen[0]["name"] = "Changed"
+    assert result.original is product
+
+
+def test_graph_state_keeps_product_as_plain_dict_for_tracing():
+    # LangSmith serializes graph state as trace input; a mappingproxy would come out as its repr
+    product = {"sku": "TEMP-6", "name": "Bowl", "price": 4.0}
+
+    result = pipeline._get_graph().invoke({"product": product, "events": []})
+
+    assert type(result["product"]) is dict
+
+
+def test_enrich_product_keeps_only_the_most_recent_events(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(pipeline, "_MAX_EVENTS", 3)
+    seen = []
+
+    result = enrich_product({"sku": "TEMP-4", "name": "Cup", "price": 2.0}, on_event=seen.append)
+
+    assert result.events == seen[-3:]
+    assert len(seen) > 3
+    assert result.events[-1].step == "publish"
+
+
+def test_enrich_product_keeps_no_events_when_cap_is_zero(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(pipeline, "_MAX_EVENTS", 0)
+
+    result = enrich_product({"sku": "TEMP-5", "name": "Cup", "price": 2.0})
+
+    assert result.events == []
+
+
 def test_process_pending_products_appends_enriched_records(temp_catalog: tuple[Path, Path]):
     simple, enriched = temp_catalog
 
@@ -66,3 +116,117 @@ def test_process_pending_products_appends_enriched_records(temp_catalog: tuple[P
 
     repeat = process_pending_products(str(simple), str(enriched), process_all=True)
     assert repeat == []
+
+
+def test_process_pending_products_without_persist_leaves_catalog_untouched(temp_catalog: tuple[Path, Path]):
+    simple, enriched = temp_catalog
+    before = enriched.read_bytes()
+
+    processed = process_pending_products(str(simple), str(enriched), process_all=True, persist=False)
+
+    assert [result.sku for result in processed] == ["TEMP-1"]
+    assert enriched.read_bytes() == before
+    assert not enriched.with_suffix(".idx").exists()
+
+
+def test_process_pending_products_defaults_to_newest_pending_record(tmp_path: Path):
+    simple = tmp_path / "simple.json"
+    enriched = tmp_path / "enriched.json"
+    records = [{"sku": f"TEMP-{i}", "name": f"Item {i}", "price": 1.0, "category": "Test"} for i in range(4)]
+    simple.write_text(json.dumps(records), encoding="utf-8")
+    enriched.write_text(json.dumps([{"sku": "TEMP-3"}]), encoding="utf-8")
+
+    processed = process_pending_products(str(simple), str(enriched))
+
+    assert [result.sku for result in processed] == ["TEMP-2"]
+
+
+def test_process_pending_products_keeps_catalog_order_when_finishing_out_of_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    simple = tmp_path / "simple.json"
+    enriched = tmp_path / "enriched.json"
+    simple.write_text(json.dumps([{"sku": f"TEMP-{i}"} for i in range(3)]), encoding="utf-8")
+    enriched.write_text("[]\n", encoding="utf-8")
+    last_done = threading.Event()
+    finished = []
+
+    def fake_enrich(product):
+        # The first product only completes once the last one has
+        if product["sku"] == "TEMP-0":
+            assert last_done.wait(timeout=5)
+        finished.append(product["sku"])
+        if product["sku"] == "TEMP-2":
+            last_done.set()
+        return pipeline.ProcessedProduct(sku=product["sku"], original=product, enriched=dict(product), events=[])
+
+    monkeypatch.setattr(pipeline, "enrich_product", fake_enrich)
+
+    processed = process_pending_products(str(simple), str(enriched), process_all=True)
+
+    assert finished[-1] == "TEMP-0"
+    assert [result.sku for result in processed] == ["TEMP-0", "TEMP-1", "TEMP-2"]
+    assert [record["sku"] for record in json.loads(enriched.read_text(encoding="utf-8"))] == ["TEMP-0", "TEMP-1", "TEMP-2"]
+
+
+def test_enrich_product_reports_events_as_they_happen():
+    product = {
+        "sku": "TEMP-3",
+        "name": "Mug",
+        "description": "Ceramic mug.",
+        "attributes": {"capacity": "10 oz"},
+        "price": 8.0,
+        "currency": "USD",
+        "category": "Kitchen",
+    }
+    seen = []
+
+    result = enrich_product(product, on_event=seen.append)
+
+    assert seen == result.events
+    assert [event.step for event in seen][0] == "ingest"
+    assert seen[-1].step == "publish"
+
+
+SEO_COPY = {"title": "Mug", "description": "A mug.", "long_description": "A ceramic mug."}
+
+
+def test_ai_localize_copy_translates_all_locales_in_one_request(stub_client):
+    client = stub_client(
+        json.dumps({
+            "es-ES": {"title": "Taza", "description": "Una taza.", "long_description": "Taza de cerámica."},
+            "fr-FR": {"title": "Tasse", "description": "Une tasse.", "long_description": "Tasse en céramique."},
+        })
+    )
+    events = []
+
+    localizations = _ai_localize_copy(SEO_COPY, events, client)
+
+    assert [entry["locale"] for entry in localizations] == ["en-US", "es-ES", "fr-FR"]
+    assert localizations[2]["title"] == "Tasse"
+    assert len(client.chat.completions.calls) == 1
+    assert client.chat.completions.calls[0]["response_format"] == {"type": "json_object"}
+
+
+def test_ai_localize_copy_falls_back_to_per_locale_requests(stub_client):
+    def per_locale(kwargs):
+        # Per-locale requests run concurrently, so answer by the locale named in the prompt
+        return json.dumps({"title": "Taza" if "Spanish" in kwargs["messages"][1]["content"] else "Tasse"})
+
+    client = stub_client(json.dumps({"es-ES": {"title": "Taza"}}), per_locale, per_locale)
+    events = []
+
+    localizations = _ai_localize_copy(SEO_COPY, events, client)
+
+    assert [entry["title"] for entry in localizations] == ["Mug", "Taza", "Tasse"]
+    assert len(client.chat.completions.calls) == 3
+
+
+def test_ai_extract_attributes_falls_back_on_invalid_json(stub_client):
+    client = stub_client("not json")
+    events = []
+
+    normalized = _ai_extract_attributes({"category": "Kitchen", "attributes": {"Color": "red"}}, events, client)
+
+    assert normalized == {"color": "red", "category": "kitchen"}
+    assert events[0].message.startswith("AI extraction failed")